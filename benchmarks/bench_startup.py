@@ -0,0 +1,50 @@
+"""
+Measure the cold-start cost of the simulation core against the GUI, and the cost of setting up and stepping a run.
+Every import is timed in a fresh interpreter so nothing is already cached in sys.modules.
+
+Usage: python benchmarks/bench_startup.py [repeats]
+"""
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def cold_import(module, repeats):
+    """
+    :param module: Name of the module to import.
+    :param repeats: Number of fresh interpreters to start.
+    :return: Best wall time in seconds of starting python and importing the module.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        begin = time.perf_counter()
+        subprocess.run([sys.executable, "-c", f"import {module}"], cwd=ROOT, check=True)
+        best = min(best, time.perf_counter() - begin)
+    return best
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    baseline = cold_import("sys", repeats)
+    for module in ("numpy", "rumor", "rumor.gui"):
+        elapsed = cold_import(module, repeats)
+        print(f"cold import {module:<10} {elapsed * 1000:8.1f} ms  (+{(elapsed - baseline) * 1000:.1f} ms over bare python)")
+
+    sys.path.insert(0, ROOT)
+    from rumor import Simulation
+
+    begin = time.perf_counter()
+    simulation = Simulation(seed=0)
+    setup = time.perf_counter() - begin
+    begin = time.perf_counter()
+    simulation.run(20)
+    stepping = time.perf_counter() - begin
+    print(f"Simulation setup          {setup * 1000:8.1f} ms")
+    print(f"Simulation 20 generations {stepping * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
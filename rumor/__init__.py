@@ -0,0 +1,37 @@
+"""
+Spreading rumors model.
+
+Importing the package only loads the NumPy engine. The tkinter windows in rumor.gui are imported the first time
+one of them is accessed, so scripts and worker processes that never open a window don't pay for Tk.
+"""
+from rumor.engine import (
+    BOARD_INITIALIZERS,
+    build_board,
+    get_neighbors,
+    get_neighbors_table,
+    get_probabilities,
+    initialize_board,
+    initialize_board_half_half,
+    initialize_board_Layers,
+    initialize_board_nested_rectangles,
+    spread_rumor,
+)
+from rumor.replay import Recording, RunPlayer, RunRecorder
+from rumor.seeding import (
+    SourceEvaluator,
+    choose_start_cell,
+    greedy_sources,
+    nearest_populated,
+    random_sources,
+    s1_density_sources,
+)
+from rumor.simulation import Simulation
+
+_GUI_NAMES = ("SpreadingRumorsGUI", "ReplayGUI", "InitialParametersWindow", "ResultsWindow")
+
+
+def __getattr__(name):
+    if name in _GUI_NAMES:
+        from rumor import gui
+        return getattr(gui, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
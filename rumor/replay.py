@@ -0,0 +1,226 @@
+import zlib
+
+import numpy as np
+
+# Colors of each state of a cell, the same as in the GUI.
+COLORS = {-1: "white", 1: "blue", 2: "green", 3: "orange", 4: "red", 5: "pink"}
+
+
+def _encode_chunk(keyframe, deltas):
+    """
+    :param keyframe: Full board of the first generation in the chunk.
+    :param deltas: List of (indices, values) of the cells that changed in each of the following generations.
+    :return: The chunk serialized and compressed with zlib.
+    """
+    counts = np.array([len(indices) for indices, _ in deltas], dtype=np.int32)
+    indices = np.concatenate([indices for indices, _ in deltas]) if deltas else np.empty(0, dtype=np.int32)
+    values = np.concatenate([values for _, values in deltas]) if deltas else np.empty(0, dtype=np.int8)
+    header = np.array([len(deltas)], dtype=np.int32)
+    raw = b"".join([header.tobytes(), counts.tobytes(), indices.astype(np.int32).tobytes(),
+                    values.astype(np.int8).tobytes(), keyframe.astype(np.int8).tobytes()])
+    return zlib.compress(raw)
+
+
+def _decode_chunk(chunk, shape):
+    """
+    :param chunk: Chunk returned by _encode_chunk().
+    :param shape: Shape of the board.
+    :return: List of the boards of every generation stored in the chunk. The boards are read-only, since the
+             player hands out the same arrays every time the generation is seeked.
+    """
+    raw = zlib.decompress(chunk)
+    num_deltas = int(np.frombuffer(raw, dtype=np.int32, count=1)[0])
+    offset = 4
+    counts = np.frombuffer(raw, dtype=np.int32, count=num_deltas, offset=offset)
+    offset += counts.nbytes
+    total = int(counts.sum())
+    indices = np.frombuffer(raw, dtype=np.int32, count=total, offset=offset)
+    offset += indices.nbytes
+    values = np.frombuffer(raw, dtype=np.int8, count=total, offset=offset)
+    offset += values.nbytes
+    board = np.frombuffer(raw, dtype=np.int8, offset=offset).reshape(shape).astype(int)
+
+    boards = [board]
+    start = 0
+    for count in counts:
+        board = board.copy()
+        board.flat[indices[start:start + count]] = values[start:start + count]
+        boards.append(board)
+        start += count
+    for board in boards:
+        board.setflags(write=False)
+    return boards
+
+
+class Recording:
+    """
+    A recorded simulation run. Each generation is stored as the cells that changed since the previous generation
+    (their index in the flattened board and their new value). Every `keyframe_interval` generations a full board is
+    stored instead, and each keyframe together with the deltas that follow it is compressed as one chunk, so seeking
+    only has to decompress a single chunk.
+    """
+    def __init__(self, shape, keyframe_interval, chunks, num_frames):
+        self.shape = tuple(shape)
+        self.keyframe_interval = keyframe_interval
+        self.chunks = chunks
+        self.num_frames = num_frames
+
+    def __len__(self):
+        return self.num_frames
+
+    def nbytes(self):
+        """
+        :return: Number of bytes the compressed chunks take.
+        """
+        return sum(len(chunk) for chunk in self.chunks)
+
+    def save(self, path):
+        """
+        :param path: Path of the .npz file to write the recording to.
+        """
+        chunks = {f"chunk_{i}": np.frombuffer(chunk, dtype=np.uint8) for i, chunk in enumerate(self.chunks)}
+        # The chunks are already compressed, so there is no point in compressing the archive again.
+        np.savez(path, shape=np.array(self.shape), keyframe_interval=self.keyframe_interval,
+                 num_frames=self.num_frames, **chunks)
+
+    @classmethod
+    def load(cls, path):
+        """
+        :param path: Path of a file written by Recording.save().
+        :return: The loaded recording.
+        """
+        with np.load(path) as data:
+            num_frames = int(data["num_frames"])
+            keyframe_interval = int(data["keyframe_interval"])
+            num_chunks = -(-num_frames // keyframe_interval)
+            chunks = [data[f"chunk_{i}"].tobytes() for i in range(num_chunks)]
+            return cls(tuple(data["shape"]), keyframe_interval, chunks, num_frames)
+
+
+class RunRecorder:
+    """
+    Records the board of each generation of a run into a Recording.
+    """
+    def __init__(self, shape, keyframe_interval=50):
+        """
+        :param shape: Shape of the board.
+        :param keyframe_interval: Number of generations between two full boards.
+        """
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
+        self.shape = tuple(shape)
+        self.keyframe_interval = keyframe_interval
+        self.chunks = []
+        self.num_frames = 0
+        self._keyframe = None
+        self._deltas = []
+        self._previous = None
+
+    def record(self, board):
+        """
+        :param board: Board of the next generation.
+        """
+        flat = np.asarray(board).ravel()
+        if self.num_frames % self.keyframe_interval == 0:
+            self._flush()
+            self._keyframe = flat.copy()
+        else:
+            # Store only the cells that changed since the previous generation.
+            changed = np.flatnonzero(flat != self._previous).astype(np.int32)
+            self._deltas.append((changed, flat[changed].astype(np.int8)))
+        self._previous = flat.copy()
+        self.num_frames += 1
+
+    def _flush(self):
+        if self._keyframe is not None:
+            self.chunks.append(_encode_chunk(self._keyframe, self._deltas))
+            self._keyframe = None
+            self._deltas = []
+
+    def recording(self):
+        """
+        :return: Recording of all the generations recorded so far.
+        """
+        chunks = list(self.chunks)
+        if self._keyframe is not None:
+            chunks.append(_encode_chunk(self._keyframe, self._deltas))
+        return Recording(self.shape, self.keyframe_interval, chunks, self.num_frames)
+
+
+class RunPlayer:
+    """
+    Plays back a Recording, seeking to any generation through the keyframe that precedes it.
+    """
+    def __init__(self, recording):
+        self.recording = recording
+        self._chunk_idx = None
+        self._boards = None
+
+    def __len__(self):
+        return len(self.recording)
+
+    def seek(self, generation):
+        """
+        :param generation: Generation to seek to, 0 is the initial board.
+        :return: Board of this generation (read-only, copy it to modify it).
+        """
+        if not 0 <= generation < len(self.recording):
+            raise IndexError(f"generation {generation} is out of range for a recording of {len(self.recording)} frames")
+        chunk_idx, offset = divmod(generation, self.recording.keyframe_interval)
+        # Keep the last decoded chunk, playing forward only decompresses each chunk once.
+        if chunk_idx != self._chunk_idx:
+            self._boards = _decode_chunk(self.recording.chunks[chunk_idx], self.recording.shape)
+            self._chunk_idx = chunk_idx
+        return self._boards[offset]
+
+    def frames(self, start=0, stop=None):
+        """
+        :return: Iterator over the boards of the generations between start and stop.
+        """
+        stop = len(self.recording) if stop is None else stop
+        for generation in range(start, stop):
+            yield self.seek(generation)
+
+    def show(self, cell_size=7, delay=200):
+        """
+        :return: Open a tkinter window to replay the recording and keep it running until it is closed.
+        """
+        # tkinter is only imported when a window is actually requested.
+        from rumor.gui import ReplayGUI
+        gui = ReplayGUI(self, cell_size, delay)
+        gui.mainloop()
+
+    def export_animation(self, path, fps=5, dpi=100):
+        """
+        :param path: Output file, the extension selects the format (e.g. .gif or .mp4).
+        :param fps: Number of generations per second.
+        :param dpi: Resolution of the output.
+        """
+        try:
+            from matplotlib import animation
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.colors import BoundaryNorm, ListedColormap
+            from matplotlib.figure import Figure
+        except ImportError as e:
+            raise ImportError("Exporting an animation requires matplotlib") from e
+
+        states = sorted(COLORS)
+        cmap = ListedColormap([COLORS[state] for state in states])
+        norm = BoundaryNorm([state - 0.5 for state in states] + [states[-1] + 0.5], cmap.N)
+
+        # Render off-screen without pyplot, so the backend and the figures of the caller are left alone.
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
+        ax.set_axis_off()
+        image = ax.imshow(self.seek(0), cmap=cmap, norm=norm, interpolation="nearest")
+        title = ax.set_title("Iteration: 0")
+
+        def update(generation):
+            image.set_data(self.seek(generation))
+            title.set_text(f"Iteration: {generation}")
+            return image, title
+
+        anim = animation.FuncAnimation(fig, update, frames=len(self.recording), interval=1000 / fps, blit=False)
+        writer = "pillow" if str(path).endswith(".gif") else None
+        anim.save(path, writer=writer, fps=fps, dpi=dpi)
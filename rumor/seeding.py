@@ -0,0 +1,260 @@
+import os
+
+import numpy as np
+
+from rumor.engine import get_neighbors_table, spread_rumor
+
+
+def populated_cells(board):
+    """
+    :param board: (np.array) Matrix with each cell containing the person's level of doubt.
+    :return: Array of the (row, col) of every populated cell.
+    """
+    return np.argwhere(board != -1)
+
+
+def random_sources(board, k=1):
+    """
+    :param board: (np.array) Matrix with each cell containing the person's level of doubt.
+    :param k: Number of people that start spreading the rumor.
+    :return: List of k different populated cells, selected uniformly at random.
+    """
+    cells = populated_cells(board)
+    if k > len(cells):
+        raise ValueError(f"Cannot select {k} sources on a board with {len(cells)} populated cells")
+    chosen = np.random.choice(len(cells), size=k, replace=False)
+    return [tuple(int(x) for x in cells[i]) for i in chosen]
+
+
+def nearest_populated(board, row, col):
+    """
+    :param board: (np.array) Matrix with each cell containing the person's level of doubt.
+    :param row: Row index of the preferred cell.
+    :param col: Column index of the preferred cell.
+    :return: The populated cell closest to (row, col), which is (row, col) itself if it is populated.
+    """
+    cells = populated_cells(board)
+    if len(cells) == 0:
+        raise ValueError("Cannot select a source on an empty board")
+    # Distance in generations on the 8-neighbors grid, ties are broken by the straight line distance.
+    chebyshev = np.maximum(np.abs(cells[:, 0] - row), np.abs(cells[:, 1] - col))
+    euclidean = (cells[:, 0] - row) ** 2 + (cells[:, 1] - col) ** 2
+    best = np.lexsort((euclidean, chebyshev))[0]
+    return tuple(int(x) for x in cells[best])
+
+
+def s1_density(board, radius=1):
+    """
+    :param board: (np.array) Matrix with each cell containing the person's level of doubt.
+    :param radius: Half width of the square window around each cell.
+    :return: Matrix with the number of S1 people in the (2 * radius + 1) square window around each cell.
+    """
+    window = 2 * radius + 1
+    s1 = np.pad((board == 1).astype(int), radius)
+    # Summed area table with a leading row and column of zeros, each window is then four lookups.
+    table = np.pad(s1.cumsum(axis=0).cumsum(axis=1), ((1, 0), (1, 0)))
+    return table[window:, window:] - table[:-window, window:] - table[window:, :-window] + table[:-window, :-window]
+
+
+def s1_density_sources(board, k=1, radius=1, strict=True):
+    """
+    :param board: (np.array) Matrix with each cell containing the person's level of doubt.
+    :param k: Number of people that start spreading the rumor.
+    :param radius: Half width of the window in which S1 people are counted. Two sources are never placed in the
+           same window, so the sources don't compete over the same neighbors.
+    :param strict: If false, return fewer than k cells when no more fit on the board instead of raising.
+    :return: List of the k cells with the highest S1 density around them. Only S1, S2 and S3 people are
+             considered, an S4 person never believes the rumor so it would never spread it.
+    """
+    if k < 0:
+        raise ValueError("k must be >= 0")
+    if k == 0:
+        return []
+    density = s1_density(board, radius)
+    cells = np.argwhere(np.isin(board, (1, 2, 3)))
+    # Order the candidate cells from the highest density to the lowest.
+    order = np.argsort(-density[cells[:, 0], cells[:, 1]], kind="stable")
+    sources = []
+    for i in order:
+        row, col = (int(x) for x in cells[i])
+        if all(max(abs(row - r), abs(col - c)) > radius for r, c in sources):
+            sources.append((row, col))
+            if len(sources) == k:
+                break
+    if strict and len(sources) < k:
+        raise ValueError(f"Cannot place {k} sources at least {radius + 1} cells apart on this board")
+    return sources
+
+
+def run_from_sources(board, sources, L, num_generations, neighbors_table=None):
+    """
+    :param board: (np.array) Matrix with each cell containing the person's level of doubt.
+    :param sources: List of (row, col) of the people that start spreading the rumor.
+    :param L: The amount of generations a rumor spreader waits before spreading a rumor again.
+    :param num_generations: Number of generations to run.
+    :param neighbors_table: Optional result of get_neighbors_table() for the board.
+    :return: Percentage of the population that was exposed to the rumor after num_generations.
+    """
+    current_board = np.copy(board)
+    banned_rumor_spreaders = {}
+    rumor_received = np.zeros(board.shape)
+    flags_board = np.full(board.shape, False, dtype=bool)
+    for source in sources:
+        flags_board[tuple(source)] = True
+    exposed_percentages = 0
+    for _ in range(num_generations):
+        current_board, banned_rumor_spreaders, rumor_received, flags_board, exposed_percentages = \
+            spread_rumor(current_board, banned_rumor_spreaders, L, board, rumor_received, flags_board,
+                         neighbors_table)
+    return exposed_percentages
+
+
+# The board and its topology are sent to each worker process once, when the pool starts, instead of with every
+# candidate it evaluates.
+_worker_state = {}
+
+
+def _init_worker(board, neighbors_table, L, num_generations, trial_seeds):
+    _worker_state.update(board=board, neighbors_table=neighbors_table, L=L, num_generations=num_generations,
+                         trial_seeds=trial_seeds)
+    # Forked workers inherit the random state of the parent, so without seeds each one starts from fresh entropy,
+    # otherwise every worker and every pool would repeat the same runs.
+    if None in trial_seeds:
+        np.random.seed()
+
+
+def _score(sources, state=None):
+    state = _worker_state if state is None else state
+    exposures = []
+    for trial_seed in state["trial_seeds"]:
+        if trial_seed is not None:
+            np.random.seed(trial_seed)
+        exposures.append(run_from_sources(state["board"], sources, state["L"], state["num_generations"],
+                                          state["neighbors_table"]))
+    return float(np.mean(exposures))
+
+
+class SourceEvaluator:
+    """
+    This class scores candidate source sets on a fixed board by the mean percentage of the exposed population
+    that spread_rumor() reports after a number of generations. The neighbors of every cell are calculated once and
+    shared by all the candidates. With a seed, every candidate is run with the same sequence of random numbers,
+    so the difference between two scores comes from the sources and not from the luck of the run.
+
+    The worker processes are started on the first parallel call and reused until close() is called, so the
+    evaluator can be used as a context manager.
+    """
+    def __init__(self, board, L=3, num_generations=50, num_trials=5, seed=None, max_workers=None):
+        """
+        :param board: (np.array) Matrix with each cell containing the person's level of doubt.
+        :param L: The amount of generations a rumor spreader waits before spreading a rumor again.
+        :param num_generations: Number of generations each candidate runs.
+        :param num_trials: Number of runs averaged for each candidate.
+        :param seed: Optional seed of the first run, run i of every candidate uses seed + i.
+        :param max_workers: Number of worker processes, 1 evaluates the candidates in this process.
+        """
+        self.board = np.copy(board)
+        self.neighbors_table = get_neighbors_table(self.board)
+        self.L = L
+        self.num_generations = num_generations
+        self.num_trials = num_trials
+        self.trial_seeds = [None if seed is None else seed + i for i in range(num_trials)]
+        self.max_workers = max_workers
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        :return: Shut down the worker processes, a later parallel call starts new ones.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _state(self):
+        return {"board": self.board, "neighbors_table": self.neighbors_table, "L": self.L,
+                "num_generations": self.num_generations, "trial_seeds": self.trial_seeds}
+
+    def _score_in_process(self, candidates):
+        if None in self.trial_seeds:
+            return [_score(sources, self._state()) for sources in candidates]
+        # Seeded trials reseed the global generator, restore it so the caller's random sequence is not affected.
+        random_state = np.random.get_state()
+        try:
+            return [_score(sources, self._state()) for sources in candidates]
+        finally:
+            np.random.set_state(random_state)
+
+    def score(self, sources):
+        """
+        :param sources: List of (row, col) of the people that start spreading the rumor.
+        :return: Mean percentage of the exposed population.
+        """
+        return self._score_in_process([[tuple(source) for source in sources]])[0]
+
+    def score_many(self, candidates):
+        """
+        :param candidates: List of source sets, each a list of (row, col).
+        :return: List of the mean percentage of the exposed population of each candidate.
+        """
+        candidates = [[tuple(source) for source in sources] for sources in candidates]
+        if self.max_workers == 1 or len(candidates) <= 1:
+            return self._score_in_process(candidates)
+
+        if self._executor is None:
+            # Imported here, so `import rumor` stays cheap for code that never evaluates in parallel.
+            from concurrent.futures import ProcessPoolExecutor
+            state = self._state()
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                                 initargs=(state["board"], state["neighbors_table"], state["L"],
+                                                           state["num_generations"], state["trial_seeds"]))
+        # Send the candidates in batches, so each worker gets a few of them per round trip.
+        num_workers = self.max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(candidates) // (4 * num_workers))
+        return list(self._executor.map(_score, candidates, chunksize=chunksize))
+
+
+def greedy_sources(evaluator, k, candidates=None, num_candidates=20, radius=1):
+    """
+    :param evaluator: SourceEvaluator of the board.
+    :param k: Number of people that start spreading the rumor.
+    :param candidates: Cells the sources are chosen from, by default the num_candidates cells returned by
+           s1_density_sources().
+    :param num_candidates: Number of candidate cells when candidates is not given, fewer are used if not that many
+           fit on the board.
+    :param radius: Window radius passed to s1_density_sources().
+    :return: List of k sources, each one added to the previous ones because it gave the highest score,
+             and the score of the final set.
+    """
+    if candidates is None:
+        candidates = s1_density_sources(evaluator.board, max(k, num_candidates), radius, strict=False)
+    remaining = [tuple(cell) for cell in candidates]
+    if k > len(remaining):
+        raise ValueError(f"Cannot select {k} sources out of {len(remaining)} candidates")
+
+    sources = []
+    best_score = 0
+    for _ in range(k):
+        scores = evaluator.score_many([sources + [cell] for cell in remaining])
+        best = int(np.argmax(scores))
+        best_score = scores[best]
+        sources.append(remaining.pop(best))
+    return sources, best_score
+
+
+def choose_start_cell(board, board_choice):
+    """
+    :param board: (np.array) Matrix with each cell containing the person's level of doubt.
+    :param board_choice: Name of the board, the classic board picks a random person, the deterministic boards start
+           from the populated cell closest to the middle of the grid.
+    :return: Row and column of the person that starts spreading the rumor.
+    """
+    if board_choice == "Classic-Random":
+        return random_sources(board, 1)[0]
+    rows, cols = board.shape
+    return nearest_populated(board, rows // 2, cols // 2)
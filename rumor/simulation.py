@@ -0,0 +1,142 @@
+import numpy as np
+
+from rumor.engine import build_board, get_neighbors_table, spread_rumor
+from rumor.replay import RunRecorder
+from rumor.seeding import choose_start_cell
+
+
+class Simulation:
+    """
+    This class owns a single run of the spreading rumor model: it builds the board, selects the person that starts
+    the rumor and keeps the state that spread_rumor() passes from one generation to the next.
+    It does not depend on tkinter, so it can be used from scripts and worker processes without a display.
+    """
+    def __init__(self, size=100, P=0.6, s1_ratio=0.25, s2_ratio=0.25, s3_ratio=0.25, L=3,
+                 board_choice="Classic-Random", start=None, sources=None, seed=None, record=False,
+                 keyframe_interval=50):
+        """
+        :param size: This value sets the height and width of the grid.
+        :param P: The overall density of the population.
+        :param s1_ratio: The proportion of people who will believe every rumor they hear.
+        :param s2_ratio: The proportion of people who will believe a rumor with a 2/3 probability.
+        :param s3_ratio: The proportion of people who will believe a rumor with a 1/3 probability.
+        :param L: The amount of generations a rumor spreader waits before spreading a rumor again.
+        :param board_choice: Type of the initial board ("Classic-Random", "Layers", "Half&Half", "Nested Rectangles").
+        :param start: Optional (row, col) of the person that starts the rumor, otherwise it is selected automatically.
+        :param sources: Optional list of (row, col) of several people that start the rumor together, e.g. from one
+               of the functions in rumor.seeding. Takes precedence over start.
+        :param seed: Optional seed, so a run can be reproduced. The board, the start cell and every step use
+               numpy's global random generator, so the seed reseeds that global generator.
+        :param record: If true, the board of every generation is recorded and can be replayed with recording().
+        :param keyframe_interval: Number of generations between two full boards in the recording.
+        """
+        sum_ratio = s1_ratio + s2_ratio + s3_ratio
+        if sum_ratio > 1 or s1_ratio < 0 or s2_ratio < 0 or s3_ratio < 0:
+            raise ValueError("Sum of ratios must be <= 1 and each ratio must be >= 0")
+
+        if seed is not None:
+            np.random.seed(seed)
+
+        # Generate the size of the board (Height, Width).
+        self.size = (size, size)
+        self.L = L
+        self.board_choice = board_choice
+        self.board, self.num_populated_cells = build_board(board_choice, self.size, P, s1_ratio, s2_ratio, s3_ratio)
+        # Store the original board into a new variable to always remember the innate state of each cell.
+        self.original_doubt_lvl_spreaders = np.copy(self.board)
+
+        # The neighbors of each cell never change during the run, so they are calculated once.
+        self.neighbors_table = get_neighbors_table(self.original_doubt_lvl_spreaders)
+
+        if sources is None:
+            sources = [choose_start_cell(self.board, board_choice) if start is None else start]
+        self.sources = [tuple(source) for source in sources]
+        if not self.sources:
+            raise ValueError("At least one source is needed to start the rumor")
+        rows, cols = self.size
+        for source in self.sources:
+            if len(source) != 2 or not (0 <= source[0] < rows and 0 <= source[1] < cols):
+                raise ValueError(f"Source {source} is outside the board")
+            if self.board[source] == -1:
+                raise ValueError(f"Source {source} is not a populated cell")
+        self.start_cell = self.sources[0]
+
+        # Initialize empty dictionary of the cells that are not allowed to spread a rumor for L generations.
+        self.banned_rumor_spreaders = {}
+        # Create a new matrix to track for each generation how many rumors were received.
+        self.rumor_received = np.zeros(self.board.shape)
+        # Create a new board of boolean flags, the cells that start the rumor are the only ones set to 'true'.
+        self.flags_board = np.full(self.size, False, dtype=bool)
+        for source in self.sources:
+            self.flags_board[source] = True
+
+        self.generation = 0
+        self.exposed_percentages = 0    # Stores the current percentage of the exposed population.
+        self.exposed_population_percentages = []    # List of the percentage of the population that's been exposed.
+
+        self.recorder = RunRecorder(self.board.shape, keyframe_interval) if record else None
+        if self.recorder is not None:
+            self.recorder.record(self.board)
+
+    @property
+    def start_doubt_level(self):
+        """
+        :return: Level of doubt of the person that starts the rumor.
+        """
+        return self.original_doubt_lvl_spreaders[self.start_cell]
+
+    def step(self):
+        """
+        :return: Advance the simulation by one generation and return the percentage of the exposed population.
+        """
+        self.board, self.banned_rumor_spreaders, self.rumor_received, self.flags_board, self.exposed_percentages = \
+            spread_rumor(self.board, self.banned_rumor_spreaders, self.L, self.original_doubt_lvl_spreaders,
+                         self.rumor_received, self.flags_board, self.neighbors_table)
+        self.exposed_population_percentages.append(self.exposed_percentages)
+        self.generation += 1
+        if self.recorder is not None:
+            self.recorder.record(self.board)
+        return self.exposed_percentages
+
+    def run(self, num_generations):
+        """
+        :param num_generations: Number of generations to advance.
+        :return: List of the percentage of the exposed population after each generation of this run.
+        """
+        return [self.step() for _ in range(num_generations)]
+
+    def recording(self):
+        """
+        :return: Recording of the generations that passed so far, the initial board is generation 0.
+        """
+        if self.recorder is None:
+            raise RuntimeError("The simulation was created without record=True")
+        return self.recorder.recording()
+
+    def results(self):
+        """
+        :return: Dictionary with the results of the simulation so far, as displayed in the results window.
+        """
+        # Calculate the number of cells that were exposed to a rumor (all cells that are 'true').
+        exposed_population = np.sum(self.flags_board)
+        never_exposed = int(np.sum(~self.flags_board & (self.original_doubt_lvl_spreaders != -1)))
+        never_exposed_percentages = (never_exposed / self.num_populated_cells) * 100
+        return {
+            "Number of populated cells:": self.num_populated_cells,
+            "Number of generations that passed:": self.generation,
+            "Number of people who received the rumor": exposed_population,
+            "Percentage of people who received the rumor:": self.exposed_percentages,
+            "Number of people who never received the rumor:": never_exposed,
+            "Percentage of people who never received the rumor": round(never_exposed_percentages, 3),
+        }
+
+    def show(self, num_generations, manual_simulation=False):
+        """
+        :param num_generations: Number of generations to run in the window.
+        :param manual_simulation: If true, the generations are advanced with a button instead of automatically.
+        :return: Open the tkinter window visualizing this simulation and keep it running until it is closed.
+        """
+        # tkinter is only imported when a window is actually requested.
+        from rumor.gui import SpreadingRumorsGUI
+        gui = SpreadingRumorsGUI(self, manual_simulation, num_generations)
+        gui.mainloop()
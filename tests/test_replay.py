@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from rumor.replay import Recording, RunPlayer, RunRecorder
+from rumor.simulation import Simulation
+
+
+def record_run(num_generations=23, keyframe_interval=5):
+    simulation = Simulation(size=30, seed=4, record=True, keyframe_interval=keyframe_interval)
+    boards = [simulation.board.copy()]
+    for _ in range(num_generations):
+        simulation.step()
+        boards.append(simulation.board.copy())
+    return simulation.recording(), boards
+
+
+@pytest.mark.parametrize("keyframe_interval", [1, 5, 50])
+def test_seek_returns_every_recorded_board(keyframe_interval):
+    recording, boards = record_run(keyframe_interval=keyframe_interval)
+    player = RunPlayer(recording)
+    assert len(player) == len(boards)
+    # Seek backwards and across chunks, not only in order.
+    for generation in [len(boards) - 1, 0, 12, 4, 5, 6, 11]:
+        np.testing.assert_array_equal(player.seek(generation), boards[generation])
+    for board, expected in zip(player.frames(), boards):
+        np.testing.assert_array_equal(board, expected)
+
+
+def test_save_load_round_trip(tmp_path):
+    recording, boards = record_run()
+    path = tmp_path / "run.npz"
+    recording.save(path)
+    loaded = Recording.load(path)
+    assert loaded.shape == recording.shape
+    assert loaded.keyframe_interval == recording.keyframe_interval
+    assert loaded.chunks == recording.chunks
+    for board, expected in zip(RunPlayer(loaded).frames(), boards):
+        np.testing.assert_array_equal(board, expected)
+
+
+def test_unchanged_generations_store_no_cells():
+    board = np.full((4, 4), -1)
+    recorder = RunRecorder(board.shape, keyframe_interval=3)
+    for _ in range(3):
+        recorder.record(board)
+    board = board.copy()
+    board[2, 1] = 5
+    recorder.record(board)
+    player = RunPlayer(recorder.recording())
+    np.testing.assert_array_equal(player.seek(2), np.full((4, 4), -1))
+    np.testing.assert_array_equal(player.seek(3), board)
+
+
+def test_seeked_boards_are_read_only():
+    recording, boards = record_run()
+    player = RunPlayer(recording)
+    with pytest.raises(ValueError):
+        player.seek(7)[0, 0] = 5
+    np.testing.assert_array_equal(player.seek(7), boards[7])
+
+
+def test_seek_out_of_range():
+    recording, _ = record_run(num_generations=3)
+    with pytest.raises(IndexError):
+        RunPlayer(recording).seek(4)
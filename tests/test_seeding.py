@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from rumor.engine import initialize_board
+from rumor.seeding import (
+    SourceEvaluator,
+    greedy_sources,
+    nearest_populated,
+    random_sources,
+    s1_density,
+    s1_density_sources,
+)
+from rumor.simulation import Simulation
+
+
+@pytest.fixture
+def board():
+    np.random.seed(0)
+    board, _ = initialize_board((20, 20), 0.6, 0.3, 0.3, 0.2)
+    return board
+
+
+@pytest.mark.parametrize("radius", [0, 1, 3])
+def test_s1_density_matches_brute_force(board, radius):
+    rows, cols = board.shape
+    expected = np.zeros(board.shape, dtype=int)
+    for i in range(rows):
+        for j in range(cols):
+            window = board[max(0, i - radius):i + radius + 1, max(0, j - radius):j + radius + 1]
+            expected[i, j] = np.sum(window == 1)
+    np.testing.assert_array_equal(s1_density(board, radius), expected)
+
+
+def test_s1_density_sources_are_populated_and_spaced(board):
+    sources = s1_density_sources(board, 4, radius=2)
+    assert len(sources) == 4
+    for i, (r, c) in enumerate(sources):
+        assert board[r, c] != -1
+        for r2, c2 in sources[i + 1:]:
+            assert max(abs(r - r2), abs(c - c2)) > 2
+
+
+def test_s1_density_sources_never_pick_s4():
+    board = np.ones((5, 5), dtype=int)
+    board[1, 1] = 4
+    assert s1_density_sources(board, 1) != [(1, 1)]
+    for seed in range(5):
+        simulation = Simulation(size=50, seed=seed)
+        board = simulation.original_doubt_lvl_spreaders
+        assert all(board[source] in (1, 2, 3) for source in s1_density_sources(board, 10))
+
+
+def test_s1_density_sources_k_zero_and_negative(board):
+    assert s1_density_sources(board, 0) == []
+    with pytest.raises(ValueError):
+        s1_density_sources(board, -1)
+
+
+def test_s1_density_sources_not_strict(board):
+    with pytest.raises(ValueError):
+        s1_density_sources(board, 400, radius=2)
+    assert 0 < len(s1_density_sources(board, 400, radius=2, strict=False)) < 400
+
+
+def test_random_and_nearest_sources(board):
+    sources = random_sources(board, 5)
+    assert len(set(sources)) == 5
+    assert all(board[source] != -1 for source in sources)
+    empty = np.full((5, 5), -1)
+    empty[4, 1] = 2
+    assert nearest_populated(empty, 2, 2) == (4, 1)
+
+
+def test_pool_scores_match_in_process_scores(board):
+    candidates = [[cell] for cell in s1_density_sources(board, 4)]
+    in_process = SourceEvaluator(board, num_generations=8, num_trials=2, seed=3, max_workers=1)
+    with SourceEvaluator(board, num_generations=8, num_trials=2, seed=3, max_workers=2) as pool:
+        assert pool.score_many(candidates) == in_process.score_many(candidates)
+        # The pool is kept between calls.
+        executor = pool._executor
+        assert pool.score_many(candidates) == in_process.score_many(candidates)
+        assert pool._executor is executor
+    assert pool._executor is None
+
+
+def test_unseeded_pool_trials_differ(board):
+    candidates = [[s1_density_sources(board, 1)[0]]] * 8
+    with SourceEvaluator(board, num_generations=8, num_trials=1, max_workers=2) as evaluator:
+        first = evaluator.score_many(candidates)
+        second = evaluator.score_many(candidates)
+    assert len(set(first + second)) > 2
+
+
+def test_seeded_score_keeps_global_random_state(board):
+    evaluator = SourceEvaluator(board, num_generations=5, num_trials=2, seed=1)
+    np.random.seed(42)
+    expected = np.random.random()
+    np.random.seed(42)
+    evaluator.score(s1_density_sources(board, 1))
+    assert np.random.random() == expected
+
+
+def test_greedy_sources_on_small_board():
+    board = Simulation(size=8, seed=0).original_doubt_lvl_spreaders
+    evaluator = SourceEvaluator(board, num_generations=5, num_trials=1, seed=0, max_workers=1)
+    sources, score = greedy_sources(evaluator, 1)
+    assert len(sources) == 1
+    assert board[sources[0]] != 4
+    assert score == evaluator.score(sources)
+
+
+@pytest.mark.parametrize("source", [(-1, -1), (0, 30), (30, 0)])
+def test_simulation_rejects_sources_outside_the_board(source):
+    with pytest.raises(ValueError):
+        Simulation(size=30, seed=0, sources=[source])
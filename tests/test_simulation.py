@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from rumor.simulation import Simulation
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("module", ["rumor", "main"])
+def test_core_import_does_not_load_tk_or_multiprocessing(module):
+    code = (f"import sys, {module}\n"
+            "for name in ('tkinter', 'concurrent.futures', 'multiprocessing'):\n"
+            "    assert name not in sys.modules, name\n")
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+
+@pytest.mark.parametrize("board_choice", ["Classic-Random", "Layers", "Half&Half", "Nested Rectangles"])
+def test_same_seed_reproduces_the_run(board_choice):
+    runs = []
+    for _ in range(2):
+        simulation = Simulation(size=30, board_choice=board_choice, seed=11)
+        runs.append((simulation.start_cell, simulation.run(10), simulation.board.copy()))
+    assert runs[0][0] == runs[1][0]
+    assert runs[0][1] == runs[1][1]
+    np.testing.assert_array_equal(runs[0][2], runs[1][2])
+
+
+def test_step_advances_the_generation():
+    simulation = Simulation(size=30, seed=2)
+    assert simulation.flags_board[simulation.start_cell]
+    exposed = simulation.step()
+    assert simulation.generation == 1
+    assert simulation.exposed_population_percentages == [exposed]
+    assert simulation.results()["Number of generations that passed:"] == 1
+
+
+def test_invalid_ratios():
+    with pytest.raises(ValueError):
+        Simulation(size=10, s1_ratio=0.6, s2_ratio=0.6, s3_ratio=0)